@@ -1,10 +1,166 @@
 import sys
-from datetime import datetime, timedelta
+import time
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QColorDialog, QComboBox, 
-                             QSpinBox, QMainWindow, QStackedWidget)
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QPalette
+                             QSpinBox, QMainWindow, QStackedWidget, QGraphicsOpacityEffect)
+from PyQt6.QtCore import (QTimer, Qt, pyqtSignal, QRect, QPointF, QPropertyAnimation,
+                          QSequentialAnimationGroup)
+from PyQt6.QtGui import (QColor, QFont, QFontMetrics, QPalette, QPainter, QPixmap,
+                         QPen, QBrush, QShortcut, QKeySequence)
+
+# A tick this close before a minute boundary is treated as that boundary's tick
+_EARLY_WAKE_MS = 50
+
+# Zero-padded "00".."59", indexed directly by hour or minute
+_TWO_DIGIT = [f"{i:02d}" for i in range(60)]
+
+# Font pixel size as a fraction of the screen HEIGHT for each clock size
+SIZE_PERCENT = {
+    'Small': 0.30,        # 30% - keeps reasonable size
+    'Medium': 0.50,       # 50% - increased from 45% for better visibility
+    'Full Screen': 0.55,  # 55% - gives ~90-93% width coverage
+}
+
+# Selectable monitor resolutions, parsed to (width, height) once at import
+RESOLUTIONS = {s: tuple(map(int, s.split('x'))) for s in (
+    '1920x1080',
+    '1680x1050',
+    '1600x900',
+    '1440x900',
+    '1366x768',
+    '1360x768',
+    '1280x1024',
+    '1280x960',
+    '1280x800',
+    '1280x720',
+    '1280x600',
+)}
+
+# QFont instances keyed by (family, pixel_size), so switching modes back and
+# forth doesn't go through the font database again
+_FONT_CACHE = {}
+
+class ColonGlyph(QWidget):
+    """The colon of a ClockFace, split out so its opacity can be animated on its own."""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.parentWidget().glyph(':'))
+
+
+class ClockFace(QWidget):
+    """Draws HH:MM by blitting pre-rendered glyph pixmaps instead of laying out text."""
+
+    GLYPHS = "0123456789:"
+
+    def __init__(self):
+        super().__init__()
+        self._font = None
+        self._pen = QPen(QColor('red'))
+        self._background = QBrush(QColor('black'))
+        self._atlas = {}
+        self._digits = "0000"
+        # paintEvent fills its own background, so Qt can skip the erase pass
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        
+        # The blink is a looping group of instant opacity steps separated by
+        # pauses. Qt's animation timer sleeps through pause-only stretches, so
+        # the process wakes twice a second instead of every animation frame
+        self.colon = ColonGlyph(self)
+        self._colon_effect = QGraphicsOpacityEffect(self.colon)
+        self.colon.setGraphicsEffect(self._colon_effect)
+        self._blink = QSequentialAnimationGroup(self)
+        for opacity in (1.0, 0.0):
+            step = QPropertyAnimation(self._colon_effect, b"opacity", self._blink)
+            step.setDuration(0)
+            step.setEndValue(opacity)
+            self._blink.addAnimation(step)
+            self._blink.addPause(500)
+        self._blink.setLoopCount(-1)
+        
+        self.set_font(QFont('Monospace'))
+
+    def set_font(self, font):
+        # Fonts come from _FONT_CACHE, so the same object means nothing to redo
+        if font is self._font:
+            return
+        self._font = font
+        
+        # Every digit gets the same fixed-width cell, so the widget size and
+        # the glyph positions never change with the time being shown
+        fm = QFontMetrics(font)
+        self._digit_w = fm.horizontalAdvance("0")
+        self._colon_w = fm.horizontalAdvance(":")
+        self._height = fm.height()
+        self._digit_x = (0, self._digit_w,
+                         2 * self._digit_w + self._colon_w, 3 * self._digit_w + self._colon_w)
+        self._colon_rect = QRect(2 * self._digit_w, 0, self._colon_w, self._height)
+        self.setFixedSize(4 * self._digit_w + self._colon_w, self._height)
+        self.colon.setGeometry(self._colon_rect)
+        self._invalidate_atlas()
+
+    def set_colors(self, pen, background):
+        # Glyphs are rendered on a transparent background, only the pen needs a rebuild
+        if pen is not self._pen:
+            self._pen = pen
+            self._invalidate_atlas()
+        self._background = background
+        self.update()
+
+    def set_time(self, hours, minutes):
+        self._digits = hours + minutes
+        self.update()
+
+    def start_blink(self):
+        # Phase-lock the animation so the colon lights up on each wall-clock second
+        self._blink.start()
+        self._blink.setCurrentTime(int(time.time() * 1000) % 1000)
+
+    def stop_blink(self):
+        self._blink.stop()
+
+    def glyph(self, ch):
+        self._ensure_atlas()
+        return self._atlas[ch]
+
+    def _invalidate_atlas(self):
+        # Rebuilt lazily on the next paint
+        self._atlas = {}
+        self.update()
+        self.colon.update()
+
+    def _build_atlas(self, font, pen):
+        fm = QFontMetrics(font)
+        dpr = self.devicePixelRatioF()
+        self._atlas = {}
+        for ch in self.GLYPHS:
+            width = self._colon_w if ch == ':' else self._digit_w
+            pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(self._height * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setFont(font)
+            painter.setPen(pen)
+            # Center the glyph in its cell in case the font isn't truly monospaced
+            painter.drawText(QPointF((width - fm.horizontalAdvance(ch)) / 2, fm.ascent()), ch)
+            painter.end()
+            self._atlas[ch] = pixmap
+
+    def _ensure_atlas(self):
+        if not self._atlas:
+            self._build_atlas(self._font, self._pen)
+
+    def paintEvent(self, event):
+        self._ensure_atlas()
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._background)
+        
+        # Cheap early-out for blink frames, where only the colon slot is dirty
+        if self._colon_rect.contains(event.rect()):
+            return
+        
+        for x, ch in zip(self._digit_x, self._digits):
+            painter.drawPixmap(x, 0, self._atlas[ch])
 
 class DigitalClockWidget(QWidget):
     # Signal to request returning to settings
@@ -13,9 +169,18 @@ class DigitalClockWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.settings = {}
+        # Single-shot timer re-armed on every tick so it stays locked to the wall-clock minute;
+        # the colon blink runs on its own animation and needs no Python wake-ups
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.colon_visible = True
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._tick, Qt.ConnectionType.DirectConnection)
+        self._last_hm = None
+        self._text_color_name = None
+        self._text_pen = None
+        self._running = False
+        # Stop waking up at all while the OS has suspended the app
+        QApplication.instance().applicationStateChanged.connect(self._on_application_state_changed)
         
         self.init_ui()
         
@@ -23,78 +188,117 @@ class DigitalClockWidget(QWidget):
         self.setAutoFillBackground(True)
         
         layout = QVBoxLayout()
-        self.time_label = QLabel()
-        self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.time_label)
+        self.time_area = ClockFace()
+        layout.addWidget(self.time_area, alignment=Qt.AlignmentFlag.AlignCenter)
         self.setLayout(layout)
+        
+        # Esc returns to settings; matched by Qt's shortcut map, no key event reaches Python
+        QShortcut(QKeySequence(Qt.Key.Key_Escape), self, activated=self.return_to_settings.emit)
 
     def start_clock(self, settings):
         self.settings = settings
         
         # Apply Colors
+        self._bg_qcolor = self.settings.get('bg_color', QColor('black'))
+        self._bg_brush = QBrush(self._bg_qcolor)
+        # The name is cached in settings at pick time; an unchanged color keeps the pen and atlas
+        text_color_name = self.settings.get('text_color_name') or self.settings['text_color'].name()
+        if text_color_name != self._text_color_name:
+            self._text_color_name = text_color_name
+            self._text_pen = QPen(QColor(text_color_name))
+        
         palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, self.settings['bg_color'])
+        palette.setColor(QPalette.ColorRole.Window, self._bg_qcolor)
         self.setPalette(palette)
+        self.time_area.set_colors(self._text_pen, self._bg_brush)
         
-        palette = self.time_label.palette()
-        palette.setColor(QPalette.ColorRole.WindowText, self.settings['text_color'])
-        self.time_label.setPalette(palette)
+        # Precompute everything the tick needs so it never touches the settings dict
+        self._offset_seconds = int(self.settings['gmt_offset']) * 3600
         
-        self.timer.start(500)
-        self.setFocus() # Important to catch key events
+        # Draw the current time right away, then tick on each minute boundary
+        self._last_hm = None
+        self._running = True
+        self._tick()
+        self.time_area.start_blink()
 
     def stop_clock(self):
+        self._running = False
+        self._pause()
+
+    def _pause(self):
         self.timer.stop()
+        self.time_area.stop_blink()
+
+    def _can_tick(self):
+        # Minimizing sends a hide event, so isVisible() alone covers it via _pause/_resume
+        return (self._running and self.isVisible()
+                and QApplication.instance().applicationState() != Qt.ApplicationState.ApplicationSuspended)
+
+    def _resume(self):
+        if self._can_tick() and not self.timer.isActive():
+            self._tick()
+            self.time_area.start_blink()
+
+    def _schedule_next_tick(self, now):
+        # GMT offsets are whole hours, so the UTC minute boundary is the local one too
+        delay = 60000 - int(now * 1000) % 60000
+        # Woken a hair before the boundary: _tick already drew that boundary's minute
+        if delay <= _EARLY_WAKE_MS:
+            delay += 60000
+        self.timer.start(delay)
+
+    def _tick(self):
+        # One clock read per tick feeds both the digits and the next deadline
+        now = time.time()
+        # The timer may fire slightly before the boundary it was armed for (NTP
+        # slews the wall clock against the monotonic timer), so round up to it
+        self.update_time(now + _EARLY_WAKE_MS / 1000)
+        # Not re-armed while nobody can see the clock; _resume picks it back up
+        if self._can_tick():
+            self._schedule_next_tick(now)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._pause()
+
+    def _on_application_state_changed(self, state):
+        if state == Qt.ApplicationState.ApplicationSuspended:
+            self._pause()
+        else:
+            self._resume()
 
     def update_font_size(self, target_height, target_width, size_mode):
-        # Calculate font size based on mode
-        # All modes now use HEIGHT as base dimension
-        if size_mode == 'Small':
-            percentage = 0.30  # 30% - keeps reasonable size
-        elif size_mode == 'Medium':
-            percentage = 0.50  # 50% - increased from 45% for better visibility
-        else:  # Full Screen
-            percentage = 0.55  # 55% - gives ~90-93% width coverage
-        
-        # Always use height as base dimension
-        pixel_size = int(target_height * percentage)
+        # All modes use HEIGHT as base dimension
+        pixel_size = int(target_height * SIZE_PERCENT[size_mode])
         
         # Get font family from settings, default to system font
         font_family = self.settings.get('font_family', 'Monospace')
-        font = QFont(font_family)
-        font.setPixelSize(pixel_size)
-        self.time_label.setFont(font)
-
-    def update_time(self):
-        if not self.settings:
-            return
+        key = (font_family, pixel_size)
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            font = QFont(font_family)
+            font.setPixelSize(pixel_size)
+            font.setFixedPitch(True)
+            # Glyphs are rasterized into transparent atlas pixmaps and later blitted onto
+            # the background; LCD subpixel coverage would bake in color fringes meant for
+            # a background the glyph never saw, so ask for plain grayscale antialiasing
+            font.setStyleStrategy(QFont.StyleStrategy.NoSubpixelAntialias)
+            _FONT_CACHE[key] = font
+        self.time_area.set_font(font)
 
-        utc_now = datetime.utcnow()
-        offset = self.settings.get('gmt_offset', 0)
-        current_time = utc_now + timedelta(hours=offset)
+    def update_time(self, now):
+        t = int(now) + self._offset_seconds
+        hours = (t // 3600) % 24
+        minutes = (t // 60) % 60
         
-        hours = current_time.strftime("%H")
-        minutes = current_time.strftime("%M")
-        
-        # Get text color from settings
-        text_color = self.settings.get('text_color', QColor('red')).name()
-        
-        # Use HTML to make colon blink without changing layout
-        # The colon is always there, just changes between visible and transparent
-        if self.colon_visible:
-            colon_html = f'<span style="color:{text_color};">:</span>'
-        else:
-            colon_html = f'<span style="color:transparent;">:</span>'
-            
-        time_html = f'{hours}{colon_html}{minutes}'
-        self.time_label.setText(time_html)
-        self.colon_visible = not self.colon_visible
-
-    def keyPressEvent(self, event):
-        if event.key() == Qt.Key.Key_Escape:
-            self.return_to_settings.emit()
-        else:
-            super().keyPressEvent(event)
+        # Digits only need new text when the minute rolls over
+        if (hours, minutes) != self._last_hm:
+            self.time_area.set_time(_TWO_DIGIT[hours], _TWO_DIGIT[minutes])
+            self._last_hm = (hours, minutes)
 
 class SettingsWidget(QWidget):
     start_clock_signal = pyqtSignal(dict)
@@ -109,6 +313,9 @@ class SettingsWidget(QWidget):
             'font_family': 'Monospace',
             'resolution': '1920x1080'  # Default resolution
         }
+        self.settings['text_color_name'] = self.settings['text_color'].name()
+        # Button stylesheet per picked color (keyed by QColor.rgb())
+        self._css_cache = {}
         self.init_ui()
 
     def init_ui(self):
@@ -142,7 +349,7 @@ class SettingsWidget(QWidget):
         size_layout = QHBoxLayout()
         size_layout.addWidget(QLabel("Clock Size:"))
         self.size_combo = QComboBox()
-        self.size_combo.addItems(['Small', 'Medium', 'Full Screen'])
+        self.size_combo.addItems(list(SIZE_PERCENT))
         self.size_combo.setCurrentText(self.settings['size'])
         self.size_combo.currentTextChanged.connect(self.set_size)
         size_layout.addWidget(self.size_combo)
@@ -174,19 +381,7 @@ class SettingsWidget(QWidget):
         resolution_layout = QHBoxLayout()
         resolution_layout.addWidget(QLabel("Monitor Resolution:"))
         self.resolution_combo = QComboBox()
-        self.resolution_combo.addItems([
-            '1920x1080',
-            '1680x1050',
-            '1600x900',
-            '1440x900',
-            '1366x768',
-            '1360x768',
-            '1280x1024',
-            '1280x960',
-            '1280x800',
-            '1280x720',
-            '1280x600'
-        ])
+        self.resolution_combo.addItems(list(RESOLUTIONS))
         self.resolution_combo.setCurrentText(self.settings['resolution'])
         self.resolution_combo.currentTextChanged.connect(self.set_resolution)
         resolution_layout.addWidget(self.resolution_combo)
@@ -202,19 +397,37 @@ class SettingsWidget(QWidget):
         self.setLayout(layout)
 
     def update_color_btn(self, btn, color):
-        btn.setStyleSheet(f"background-color: {color.name()}; color: {'white' if color.lightness() < 128 else 'black'}")
+        rgb = color.rgb()
+        css = self._css_cache.get(rgb)
+        if css is None:
+            fg = 'white' if color.lightness() < 128 else 'black'
+            css = f"background-color: {color.name()}; color: {fg}"
+            self._css_cache[rgb] = css
+        btn.setStyleSheet(css)
+
+    def open_color_dialog(self, initial, title, on_selected):
+        # colorSelected only fires when the user confirms, so live preview
+        # in the dialog never reaches the settings or the button stylesheet
+        dialog = QColorDialog(initial, self)
+        dialog.setWindowTitle(title)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.colorSelected.connect(on_selected)
+        dialog.open()
 
     def choose_bg_color(self):
-        color = QColorDialog.getColor(self.settings['bg_color'], self, "Select Background Color")
-        if color.isValid():
-            self.settings['bg_color'] = color
-            self.update_color_btn(self.bg_btn, color)
+        self.open_color_dialog(self.settings['bg_color'], "Select Background Color", self.set_bg_color)
 
     def choose_text_color(self):
-        color = QColorDialog.getColor(self.settings['text_color'], self, "Select Text Color")
-        if color.isValid():
-            self.settings['text_color'] = color
-            self.update_color_btn(self.text_btn, color)
+        self.open_color_dialog(self.settings['text_color'], "Select Text Color", self.set_text_color)
+
+    def set_bg_color(self, color):
+        self.settings['bg_color'] = color
+        self.update_color_btn(self.bg_btn, color)
+
+    def set_text_color(self, color):
+        self.settings['text_color'] = color
+        self.settings['text_color_name'] = color.name()
+        self.update_color_btn(self.text_btn, color)
 
     def set_size(self, text):
         self.settings['size'] = text
@@ -240,31 +453,31 @@ class MainApp(QMainWindow):
         self.setCentralWidget(self.stacked_widget)
         
         self.settings_widget = SettingsWidget()
-        self.clock_widget = DigitalClockWidget()
-        
         self.stacked_widget.addWidget(self.settings_widget)
-        self.stacked_widget.addWidget(self.clock_widget)
+        # Built on the first Start so a session that never leaves settings doesn't pay for it
+        self.clock_widget = None
         
         # Connect signals
-        self.settings_widget.start_clock_signal.connect(self.show_clock)
-        self.clock_widget.return_to_settings.connect(self.show_settings)
+        self.settings_widget.start_clock_signal.connect(self.show_clock, Qt.ConnectionType.DirectConnection)
         
         self.show_settings()
 
     def show_settings(self):
-        self.clock_widget.stop_clock()
+        if self.clock_widget is not None:
+            self.clock_widget.stop_clock()
         self.showNormal()
         self.resize(400, 500) # Default settings size
         self.stacked_widget.setCurrentWidget(self.settings_widget)
 
     def show_clock(self, settings):
+        if self.clock_widget is None:
+            self.clock_widget = DigitalClockWidget()
+            self.clock_widget.return_to_settings.connect(self.show_settings, Qt.ConnectionType.DirectConnection)
+            self.stacked_widget.addWidget(self.clock_widget)
         self.stacked_widget.setCurrentWidget(self.clock_widget)
         
-        # Parse selected resolution from settings
-        resolution = settings.get('resolution', '1920x1080')
-        width_str, height_str = resolution.split('x')
-        screen_width = int(width_str)
-        screen_height = int(height_str)
+        # Selected resolution was already parsed at import time
+        screen_width, screen_height = RESOLUTIONS[settings.get('resolution', '1920x1080')]
         
         size_mode = settings['size']
         if size_mode == 'Full Screen':
@@ -276,14 +489,10 @@ class MainApp(QMainWindow):
             elif size_mode == 'Medium':
                 self.resize(800, 400)
         
-        # Force layout update to get correct dimensions
-        QApplication.processEvents()
-        
         # Start clock logic and set font size based on SELECTED resolution
         # This uses the user's manually selected monitor resolution
         self.clock_widget.start_clock(settings)
         self.clock_widget.update_font_size(screen_height, screen_width, settings['size'])
-        self.clock_widget.setFocus() # Ensure it gets key events
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
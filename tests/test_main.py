@@ -0,0 +1,54 @@
+import os
+import sys
+from types import SimpleNamespace
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QColor
+
+import main
+
+# 12:01:00 UTC on some day, a minute boundary
+BOUNDARY = 86400 * 20000 + 12 * 3600 + 60
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def clock(app):
+    widget = main.DigitalClockWidget()
+    yield widget
+    widget.stop_clock()
+
+
+def tick_at(clock, monkeypatch, now):
+    # Only main's view of the clock is pinned; start_clock runs the real _tick,
+    # which re-arms the timer because the widget is visible
+    monkeypatch.setattr(main, 'time', SimpleNamespace(time=lambda: now))
+    clock.show()
+    clock.start_clock({'bg_color': QColor('black'), 'text_color': QColor('red'), 'gmt_offset': 0})
+    assert clock.timer.isActive()
+
+
+def test_early_wake_shows_the_new_minute(clock, monkeypatch):
+    tick_at(clock, monkeypatch, BOUNDARY - 0.005)
+    assert clock._last_hm == (12, 1)
+    # Re-armed for the following boundary, not the one just handled
+    assert clock.timer.interval() == 60005
+
+
+def test_late_wake_shows_the_new_minute(clock, monkeypatch):
+    tick_at(clock, monkeypatch, BOUNDARY + 0.030)
+    assert clock._last_hm == (12, 1)
+    assert clock.timer.interval() == 59970
+
+
+def test_text_color_without_cached_name(clock):
+    clock.start_clock({'bg_color': QColor('black'), 'text_color': QColor('yellow'), 'gmt_offset': 0})
+    assert clock._text_pen.color().name() == QColor('yellow').name()